@@ -5,7 +5,6 @@ import binascii
 
 import ecdsa
 from lbry import utils
-from lbry.crypto.hash import sha256
 from lbry.wallet.transaction import Output
 
 log = logging.getLogger(__name__)
@@ -33,14 +32,12 @@ def is_comment_signed_by_channel(comment: dict, channel: Output, sign_comment_id
 
 
 def verify(channel, data, signature, channel_hash=None):
-    pieces = [
-        signature['signing_ts'].encode(),
-        channel_hash or channel.claim_hash,
-        data
-    ]
+    digest = hashlib.sha256(signature['signing_ts'].encode())
+    digest.update(channel_hash or channel.claim_hash)
+    digest.update(data)
     return Output.is_signature_valid(
         get_encoded_signature(signature['signature']),
-        sha256(b''.join(pieces)),
+        digest.digest(),
         channel.claim.channel.public_key_bytes
     )
 
@@ -52,9 +49,10 @@ def sign_comment(comment: dict, channel: Output, sign_comment_id=False):
 
 def sign(channel, data):
     timestamp = str(int(time.time()))
-    pieces = [timestamp.encode(), channel.claim_hash, data]
-    digest = sha256(b''.join(pieces))
-    signature = channel.private_key.sign_digest_deterministic(digest, hashfunc=hashlib.sha256)
+    digest = hashlib.sha256(timestamp.encode())
+    digest.update(channel.claim_hash)
+    digest.update(data)
+    signature = Output.sign_digest(channel.private_key, digest.digest())
     return {
         'signature': binascii.hexlify(signature).decode(),
         'signing_ts': timestamp
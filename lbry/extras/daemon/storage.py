@@ -351,7 +351,7 @@ class SQLiteStorage(SQLiteMixin):
             return row
 
     async def run_and_return_list(self, query, *args):
-        rows = list(await self.db.execute_fetchall(query, args))
+        rows = await self.db.execute_fetchall(query, args)
         return [col[0] for col in rows] if rows else []
 
     # # # # # # # # # blob functions # # # # # # # # #
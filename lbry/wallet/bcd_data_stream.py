@@ -53,6 +53,16 @@ class BCDataStream:
             self.write_uint8(255)
             self.write_uint64(size)
 
+    @staticmethod
+    def compact_size_length(size):
+        if size < 253:
+            return 1
+        if size <= 0xFFFF:
+            return 3
+        if size <= 0xFFFFFFFF:
+            return 5
+        return 9
+
     def read_boolean(self):
         return self.read_uint8() != 0
 
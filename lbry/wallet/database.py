@@ -27,6 +27,18 @@ else:
 log = logging.getLogger(__name__)
 sqlite3.enable_callback_tracebacks(True)
 
+# queries are built from a small set of templates, keep more of them compiled than the default 100
+SQLITE_CACHED_STATEMENTS = 512
+
+# per-connection settings, unlike journal_mode these are not persisted in the database file
+CONNECTION_PRAGMAS = """
+    pragma journal_mode=WAL;
+    pragma synchronous=normal;
+    pragma temp_store=memory;
+    pragma cache_size=-16384;
+    pragma mmap_size=268435456;
+"""
+
 HISTOGRAM_BUCKETS = (
     .005, .01, .025, .05, .075, .1, .25, .5, .75, 1.0, 2.5, 5.0, 7.5, 10.0, 15.0, 20.0, 30.0, 60.0, float('inf')
 )
@@ -41,9 +53,9 @@ reader_context: Optional[ContextVar[ReaderProcessState]] = ContextVar('reader_co
 
 
 def initializer(path):
-    db = sqlite3.connect(path)
+    db = sqlite3.connect(path, cached_statements=SQLITE_CACHED_STATEMENTS)
     db.row_factory = dict_row_factory
-    db.executescript("pragma journal_mode=WAL;")
+    db.executescript(CONNECTION_PRAGMAS)
     reader = ReaderProcessState(db.cursor())
     reader_context.set(reader)
 
@@ -103,10 +115,12 @@ class AIOSQLite:
     @classmethod
     async def connect(cls, path: Union[bytes, str], *args, **kwargs):
         sqlite3.enable_callback_tracebacks(True)
+        kwargs.setdefault('cached_statements', SQLITE_CACHED_STATEMENTS)
         db = cls()
 
         def _connect_writer():
             db.writer_connection = sqlite3.connect(path, *args, **kwargs)
+            db.writer_connection.executescript(CONNECTION_PRAGMAS)
 
         readers = max(os.cpu_count() - 2, 2)
         db.reader_executor = ReaderExecutorClass(
@@ -123,6 +137,7 @@ class AIOSQLite:
         self._closing = True
 
         def __checkpoint_and_close(conn: sqlite3.Connection):
+            conn.execute("PRAGMA optimize;")
             conn.execute("PRAGMA WAL_CHECKPOINT(FULL);")
             log.info("DB checkpoint finished.")
             conn.close()
@@ -491,11 +506,17 @@ class SQLiteMixin:
         return sql, values
 
 
+# (description, column names) of the last result set seen by dict_row_factory, swapped
+# as a single tuple so reader threads sharing the module never see a mismatched pair
+_ROW_COLUMNS: List[Tuple[Optional[tuple], Tuple[str, ...]]] = [(None, ())]
+
+
 def dict_row_factory(cursor, row):
-    d = {}
-    for idx, col in enumerate(cursor.description):
-        d[col[0]] = row[idx]
-    return d
+    description = cursor.description
+    columns = _ROW_COLUMNS[0]
+    if columns[0] is not description:
+        columns = _ROW_COLUMNS[0] = (description, tuple(col[0] for col in description))
+    return dict(zip(columns[1], row))
 
 
 SQLITE_MAX_INTEGER = 9223372036854775807
@@ -1,4 +1,4 @@
-from binascii import hexlify, unhexlify
+from binascii import unhexlify
 from .constants import NULL_HASH32
 
 
@@ -39,7 +39,7 @@ class TXRefImmutable(TXRef):
     def from_hash(cls, tx_hash: bytes, height: int) -> 'TXRefImmutable':
         ref = cls()
         ref._hash = tx_hash
-        ref._id = hexlify(tx_hash[::-1]).decode()
+        ref._id = tx_hash[::-1].hex()
         ref._height = height
         return ref
 
@@ -3,10 +3,13 @@ import hashlib
 import logging
 import typing
 import asyncio
+from functools import lru_cache
+from operator import attrgetter
 from binascii import hexlify, unhexlify
 from typing import List, Iterable, Optional, Tuple
 
 import ecdsa
+from coincurve import PrivateKey as _PrivateKey, PublicKey as _PublicKey
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.serialization import load_der_public_key
 from cryptography.hazmat.primitives import hashes
@@ -15,7 +18,7 @@ from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 from cryptography.exceptions import InvalidSignature
 
 from lbry.error import InsufficientFundsError
-from lbry.crypto.hash import hash160, sha256
+from lbry.crypto.hash import hash160, double_sha256
 from lbry.crypto.base58 import Base58
 from lbry.schema.url import normalize_name
 from lbry.schema.claim import Claim
@@ -36,6 +39,21 @@ if typing.TYPE_CHECKING:
 
 log = logging.getLogger()
 
+_BE_UINT32 = struct.Struct('>I')
+
+_SECP256K1_ORDER = ecdsa.SECP256k1.order
+# SubjectPublicKeyInfo header of an uncompressed secp256k1 key, as written by ecdsa's VerifyingKey.to_der()
+_SECP256K1_DER_PREFIX = unhexlify('3056301006072a8648ce3d020106052b8104000a034200')
+_PREHASHED_SHA256_ECDSA = ec.ECDSA(Prehashed(hashes.SHA256()))
+
+
+@lru_cache(maxsize=10000)
+def _load_public_key(public_key_bytes: bytes):
+    """ libsecp256k1 key for standard channel keys, falls back to OpenSSL for any other DER encoding. """
+    if len(public_key_bytes) == 88 and public_key_bytes.startswith(_SECP256K1_DER_PREFIX):
+        return _PublicKey(public_key_bytes[len(_SECP256K1_DER_PREFIX):])
+    return load_der_public_key(public_key_bytes, default_backend())
+
 
 class TXRefMutable(TXRef):
 
@@ -48,13 +66,13 @@ class TXRefMutable(TXRef):
     @property
     def id(self):
         if self._id is None:
-            self._id = hexlify(self.hash[::-1]).decode()
+            self._id = self.hash[::-1].hex()
         return self._id
 
     @property
     def hash(self):
         if self._hash is None:
-            self._hash = sha256(sha256(self.tx.raw_sans_segwit))
+            self._hash = double_sha256(self.tx.raw_sans_segwit)
         return self._hash
 
     @property
@@ -147,6 +165,13 @@ class Input(InputOutput):
     def is_coinbase(self):
         return self.coinbase is not None
 
+    @property
+    def size(self) -> int:
+        """ Size of this input in bytes, same as len() of serialize_to() output. """
+        script = self.coinbase if self.is_coinbase else self.script.source
+        # previous tx hash (32) + previous output position (4) + sequence (4)
+        return 40 + BCDataStream.compact_size_length(len(script)) + len(script)
+
     @classmethod
     def spend(cls, txo: 'Output') -> 'Input':
         """ Create an input to spend the output."""
@@ -213,7 +238,7 @@ class Output(InputOutput):
         'amount', 'script', 'is_internal_transfer', 'is_spent', 'is_my_output', 'is_my_input',
         'channel', 'private_key', 'meta', 'sent_supports', 'sent_tips', 'received_tips',
         'purchase', 'purchased_claim', 'purchase_receipt',
-        'reposted_claim', 'claims', '_signable'
+        'reposted_claim', 'claims', '_signable', '_claim_hash', '_claim_id'
     )
 
     def __init__(self, amount: int, script: OutputScript,
@@ -242,6 +267,10 @@ class Output(InputOutput):
         self.reposted_claim: 'Output' = None  # txo representing claim being reposted
         self.claims: List['Output'] = None  # resolved claims for collection
         self._signable: Optional[Signable] = None
+        # (tx hash, position, claim hash) and (claim hash, claim id), recomputed
+        # whenever the key no longer matches, e.g. when the tx is re-serialized
+        self._claim_hash: Optional[Tuple[bytes, int, bytes]] = None
+        self._claim_id: Optional[Tuple[bytes, str]] = None
         self.meta = {}
 
     def update_annotations(self, annotated: 'Output'):
@@ -320,6 +349,13 @@ class Output(InputOutput):
         stream.write_uint64(self.amount)
         stream.write_string(self.script.source)
 
+    @property
+    def size(self) -> int:
+        """ Size of this output in bytes, same as len() of serialize_to() output. """
+        script = self.script.source
+        # amount (8)
+        return 8 + BCDataStream.compact_size_length(len(script)) + len(script)
+
     def get_fee(self, ledger):
         name_fee = 0
         if self.script.is_claim_name:
@@ -341,7 +377,13 @@ class Output(InputOutput):
     @property
     def claim_hash(self) -> bytes:
         if self.script.is_claim_name:
-            return hash160(self.tx_ref.hash + struct.pack('>I', self.position))
+            tx_hash = self.tx_ref.hash
+            cached = self._claim_hash
+            if cached is None or cached[0] is not tx_hash or cached[1] != self.position:
+                cached = self._claim_hash = (
+                    tx_hash, self.position, hash160(tx_hash + _BE_UINT32.pack(self.position))
+                )
+            return cached[2]
         elif self.script.is_update_claim or self.script.is_support_claim:
             return self.script.values['claim_id']
         else:
@@ -349,7 +391,11 @@ class Output(InputOutput):
 
     @property
     def claim_id(self) -> str:
-        return hexlify(self.claim_hash[::-1]).decode()
+        claim_hash = self.claim_hash
+        cached = self._claim_id
+        if cached is None or cached[0] is not claim_hash:
+            cached = self._claim_id = (claim_hash, claim_hash[::-1].hex())
+        return cached[1]
 
     @property
     def claim_name(self) -> str:
@@ -412,18 +458,14 @@ class Output(InputOutput):
 
     def get_signature_digest(self, ledger):
         if self.signable.unsigned_payload:
-            pieces = [
-                Base58.decode(self.get_address(ledger)),
-                self.signable.unsigned_payload,
-                self.signable.signing_channel_hash[::-1]
-            ]
+            digest = hashlib.sha256(Base58.decode(self.get_address(ledger)))
+            digest.update(self.signable.unsigned_payload)
+            digest.update(self.signable.signing_channel_hash[::-1])
         else:
-            pieces = [
-                self.tx_ref.tx.inputs[0].txo_ref.hash,
-                self.signable.signing_channel_hash,
-                self.signable.to_message_bytes()
-            ]
-        return sha256(b''.join(pieces))
+            digest = hashlib.sha256(self.tx_ref.tx.inputs[0].txo_ref.hash)
+            digest.update(self.signable.signing_channel_hash)
+            digest.update(self.signable.to_message_bytes())
+        return digest.digest()
 
     def get_encoded_signature(self):
         signature = hexlify(self.signable.signature)
@@ -434,10 +476,18 @@ class Output(InputOutput):
     @staticmethod
     def is_signature_valid(encoded_signature, signature_digest, public_key_bytes):
         try:
-            public_key = load_der_public_key(public_key_bytes, default_backend())
-            public_key.verify(encoded_signature, signature_digest, ec.ECDSA(Prehashed(hashes.SHA256())))
+            public_key = _load_public_key(bytes(public_key_bytes))
+            if isinstance(public_key, _PublicKey):
+                # libsecp256k1 only accepts low-S signatures, older signers did not normalize S
+                r, s = ecdsa.util.sigdecode_der(encoded_signature, _SECP256K1_ORDER)
+                if not (0 < r < _SECP256K1_ORDER and 0 < s < _SECP256K1_ORDER):
+                    return False
+                if s > _SECP256K1_ORDER // 2:
+                    encoded_signature = ecdsa.util.sigencode_der(r, _SECP256K1_ORDER - s, _SECP256K1_ORDER)
+                return public_key.verify(encoded_signature, signature_digest, hasher=None)
+            public_key.verify(encoded_signature, signature_digest, _PREHASHED_SHA256_ECDSA)
             return True
-        except (ValueError, InvalidSignature):
+        except (ValueError, InvalidSignature, ecdsa.der.UnexpectedDER):
             pass
         return False
 
@@ -448,15 +498,18 @@ class Output(InputOutput):
             channel.claim.channel.public_key_bytes
         )
 
+    @staticmethod
+    def sign_digest(private_key: ecdsa.SigningKey, digest: bytes) -> bytes:
+        """ RFC6979 deterministic r || s signature of digest, computed by libsecp256k1. """
+        return _PrivateKey(private_key.to_string()).sign_recoverable(digest, hasher=None)[:64]
+
     def sign(self, channel: 'Output', first_input_id=None):
         self.channel = channel
         self.signable.signing_channel_hash = channel.claim_hash
-        digest = sha256(b''.join([
-            first_input_id or self.tx_ref.tx.inputs[0].txo_ref.hash,
-            self.signable.signing_channel_hash,
-            self.signable.to_message_bytes()
-        ]))
-        self.signable.signature = channel.private_key.sign_digest_deterministic(digest, hashfunc=hashlib.sha256)
+        digest = hashlib.sha256(first_input_id or self.tx_ref.tx.inputs[0].txo_ref.hash)
+        digest.update(self.signable.signing_channel_hash)
+        digest.update(self.signable.to_message_bytes())
+        self.signable.signature = self.sign_digest(channel.private_key, digest.digest())
         self.script.generate()
 
     def clear_signature(self):
@@ -611,11 +664,12 @@ class Transaction:
 
     @property
     def raw_sans_segwit(self):
-        if self.is_segwit_flag:
-            if self._raw_sans_segwit is None:
+        if self._raw_sans_segwit is None:
+            if self.is_segwit_flag:
                 self._raw_sans_segwit = self._serialize(sans_segwit=True)
-            return self._raw_sans_segwit
-        return self.raw
+            else:
+                self._raw_sans_segwit = self.raw
+        return self._raw_sans_segwit
 
     def _reset(self):
         self._raw = None
@@ -654,24 +708,31 @@ class Transaction:
     @property
     def base_size(self) -> int:
         """ Size of transaction without inputs or outputs in bytes. """
+        if self.is_segwit_flag:
+            return (
+                self.size
+                - sum(txi.size for txi in self._inputs)
+                - sum(txo.size for txo in self._outputs)
+            )
+        # version (4) + locktime (4) + input and output counts
         return (
-            self.size
-            - sum(txi.size for txi in self._inputs)
-            - sum(txo.size for txo in self._outputs)
+            8
+            + BCDataStream.compact_size_length(len(self._inputs))
+            + BCDataStream.compact_size_length(len(self._outputs))
         )
 
     @property
     def input_sum(self):
-        return sum(i.amount for i in self.inputs if i.txo_ref.txo is not None)
+        return sum(i.amount for i in self._inputs if i.txo_ref.txo is not None)
 
     @property
     def output_sum(self):
-        return sum(o.amount for o in self.outputs)
+        return sum(o.amount for o in self._outputs)
 
     @property
     def net_account_balance(self) -> int:
         balance = 0
-        for txi in self.inputs:
+        for txi in self._inputs:
             if txi.txo_ref.txo is None:
                 continue
             if txi.is_my_input is True:
@@ -681,7 +742,7 @@ class Transaction:
                     "Cannot access net_account_balance if inputs do not "
                     "have is_my_input set properly."
                 )
-        for txo in self.outputs:
+        for txo in self._outputs:
             if txo.is_my_output is True:
                 balance += txo.amount
             elif txo.is_my_output is None:
@@ -953,36 +1014,36 @@ class Transaction:
 
     @property
     def my_inputs(self):
-        for txi in self.inputs:
+        for txi in self._inputs:
             if txi.txo_ref.txo is not None and txi.txo_ref.txo.is_my_output:
                 yield txi
 
     def _filter_my_outputs(self, f):
-        for txo in self.outputs:
+        for txo in self._outputs:
             if txo.is_my_output and f(txo.script):
                 yield txo
 
     def _filter_other_outputs(self, f):
-        for txo in self.outputs:
+        for txo in self._outputs:
             if not txo.is_my_output and f(txo.script):
                 yield txo
 
     def _filter_any_outputs(self, f):
-        for txo in self.outputs:
+        for txo in self._outputs:
             if f(txo):
                 yield txo
 
     @property
     def my_claim_outputs(self):
-        return self._filter_my_outputs(lambda s: s.is_claim_name)
+        return self._filter_my_outputs(attrgetter('is_claim_name'))
 
     @property
     def my_update_outputs(self):
-        return self._filter_my_outputs(lambda s: s.is_update_claim)
+        return self._filter_my_outputs(attrgetter('is_update_claim'))
 
     @property
     def my_support_outputs(self):
-        return self._filter_my_outputs(lambda s: s.is_support_claim)
+        return self._filter_my_outputs(attrgetter('is_support_claim'))
 
     @property
     def any_purchase_outputs(self):
@@ -990,18 +1051,17 @@ class Transaction:
 
     @property
     def other_support_outputs(self):
-        return self._filter_other_outputs(lambda s: s.is_support_claim)
+        return self._filter_other_outputs(attrgetter('is_support_claim'))
 
     @property
     def my_abandon_outputs(self):
-        for txi in self.inputs:
+        updated_claim_ids = None
+        for txi in self._inputs:
             abandon = txi.txo_ref.txo
             if abandon is not None and abandon.is_my_output and abandon.script.is_claim_involved:
-                is_update = False
                 if abandon.script.is_claim_name or abandon.script.is_update_claim:
-                    for update in self.my_update_outputs:
-                        if abandon.claim_id == update.claim_id:
-                            is_update = True
-                            break
-                if not is_update:
-                    yield abandon
+                    if updated_claim_ids is None:
+                        updated_claim_ids = {update.claim_id for update in self.my_update_outputs}
+                    if abandon.claim_id in updated_claim_ids:
+                        continue
+                yield abandon
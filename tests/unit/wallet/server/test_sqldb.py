@@ -436,7 +436,7 @@ class TestClaimtrie(TestSQLDB):
         self.assertIsNone(r_abc['canonical_url'])
 
         tx_a2 = self.get_stream_with_claim_id_prefix('a', 7, channel=txo_chan_a)
-        tx_ab2 = self.get_stream_with_claim_id_prefix('ab', 23, channel=txo_chan_a)
+        tx_ab2 = self.get_stream_with_claim_id_prefix('ab', 1831, channel=txo_chan_a)
         a2_claim = tx_a2[0].outputs[0]
         ab2_claim = tx_ab2[0].outputs[0]
         advance(6, [tx_a2])
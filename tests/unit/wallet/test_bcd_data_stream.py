@@ -21,3 +21,9 @@ class TestBCDataStream(unittest.TestCase):
         # self.assertEqual(s.read_string(), b'd'*(0xFFFFFFFF + 1))
         self.assertTrue(s.read_boolean())
         self.assertFalse(s.read_boolean())
+
+    def test_compact_size_length(self):
+        for size in (0, 252, 253, 0xFFFF, 0xFFFF + 1, 0xFFFFFFFF, 0xFFFFFFFF + 1):
+            s = BCDataStream()
+            s.write_compact_size(size)
+            self.assertEqual(BCDataStream.compact_size_length(size), len(s.get_bytes()))
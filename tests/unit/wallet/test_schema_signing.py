@@ -1,6 +1,9 @@
 from binascii import unhexlify
 
+import ecdsa
+
 from lbry.testcase import AsyncioTestCase
+from lbry.crypto.hash import sha256
 from lbry.wallet.constants import CENT, NULL_HASH32
 
 from lbry.wallet import Ledger, Database, Headers, Transaction, Input, Output
@@ -55,6 +58,63 @@ class TestSigningAndValidatingClaim(AsyncioTestCase):
         stream.claim.stream.title = 'hello'
         self.assertFalse(stream.is_signed_by(channel))
 
+    async def test_sign_digest(self):
+        channel = await get_channel()
+        digest = sha256(b'digest')
+        signature = Output.sign_digest(channel.private_key, digest)
+        self.assertEqual(len(signature), 64)
+        self.assertEqual(signature, Output.sign_digest(channel.private_key, digest))
+        self.assertTrue(channel.private_key.get_verifying_key().verify_digest(signature, digest))
+
+    async def test_validate_against_other_keys(self):
+        channel, other_channel = await get_channel(), await get_channel('@bar')
+        signed, other_signed = get_stream(), get_stream()
+        signed.sign(channel)
+        other_signed.sign(other_channel)
+        public_key, other_public_key = (
+            channel.claim.channel.public_key_bytes, other_channel.claim.channel.public_key_bytes
+        )
+        self.assertTrue(Output.is_signature_valid(
+            signed.get_encoded_signature(), signed.get_signature_digest(None), public_key
+        ))
+        self.assertFalse(Output.is_signature_valid(
+            other_signed.get_encoded_signature(), other_signed.get_signature_digest(None), public_key
+        ))
+        self.assertTrue(Output.is_signature_valid(
+            other_signed.get_encoded_signature(), other_signed.get_signature_digest(None), other_public_key
+        ))
+        self.assertFalse(Output.is_signature_valid(
+            signed.get_encoded_signature(), signed.get_signature_digest(None), b'not a key'
+        ))
+
+    async def test_high_s_signature_is_valid(self):
+        channel = await get_channel()
+        stream = get_stream()
+        stream.sign(channel)
+        order = ecdsa.SECP256k1.order
+        r, s = ecdsa.util.sigdecode_der(stream.get_encoded_signature(), order)
+        self.assertLessEqual(s, order // 2)
+        public_key = channel.claim.channel.public_key_bytes
+        high_s_signature = ecdsa.util.sigencode_der(r, order - s, order)
+        self.assertTrue(Output.is_signature_valid(high_s_signature, stream.get_signature_digest(None), public_key))
+        self.assertFalse(Output.is_signature_valid(high_s_signature, sha256(b'other'), public_key))
+        self.assertFalse(Output.is_signature_valid(b'not a signature', stream.get_signature_digest(None), public_key))
+
+    async def test_out_of_range_signature_is_invalid(self):
+        channel = await get_channel()
+        stream = get_stream()
+        stream.sign(channel)
+        order = ecdsa.SECP256k1.order
+        r, s = ecdsa.util.sigdecode_der(stream.get_encoded_signature(), order)
+        public_key = channel.claim.channel.public_key_bytes
+        digest = stream.get_signature_digest(None)
+        for bad_r, bad_s in ((r, s + order), (r, order), (r, 2**256 - 1), (r, 0), (r + order, s), (0, s)):
+            self.assertFalse(Output.is_signature_valid(
+                ecdsa.util.sigencode_der(bad_r, bad_s, order), digest, public_key
+            ))
+        stream.signable.signature = (2**256 - 1).to_bytes(32, 'big') * 2
+        self.assertFalse(stream.is_signed_by(channel))
+
     async def test_valid_private_key_for_cert(self):
         channel = await get_channel()
         self.assertTrue(channel.is_channel_private_key(channel.private_key))
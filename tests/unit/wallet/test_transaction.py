@@ -6,6 +6,7 @@ from binascii import hexlify, unhexlify
 from itertools import cycle
 
 from lbry.testcase import AsyncioTestCase
+from lbry.crypto.hash import hash160
 from lbry.wallet.constants import CENT, COIN, NULL_HASH32
 from lbry.wallet import Wallet, Account, Ledger, Database, Headers, Transaction, Output, Input
 
@@ -76,11 +77,24 @@ class TestSizeAndFeeEstimation(AsyncioTestCase):
         self.assertEqual(txi.size, 148)
         self.assertEqual(txi.get_fee(self.ledger), 148 * FEE_PER_BYTE)
 
+    def test_coinbase_input_size(self):
+        raw = unhexlify(
+            "01000000010000000000000000000000000000000000000000000000000000000000000000ffffffff1f0"
+            "4ffff001d010417696e736572742074696d657374616d7020737472696e67ffffffff01000004bfc91b8e"
+            "001976a914345991dbf57bfb014b87006acdfafbfc5fe8292f88ac00000000"
+        )
+        tx = Transaction(raw)
+        self.assertEqual(tx.inputs[0].size, 72)
+        self.assertEqual(tx.outputs[0].size, 34)
+        self.assertEqual(tx.size, len(raw))
+
     def test_transaction_size_and_fee(self):
         tx = get_transaction()
         self.assertEqual(tx.size, 204)
         self.assertEqual(tx.base_size, tx.size - tx.inputs[0].size - tx.outputs[0].size)
         self.assertEqual(tx.get_base_fee(self.ledger), FEE_PER_BYTE * tx.base_size)
+        tx.add_outputs([Output.pay_pubkey_hash(CENT, NULL_HASH32) for _ in range(252)])
+        self.assertEqual(tx.base_size, tx.size - tx.inputs[0].size - sum(txo.size for txo in tx.outputs))
 
 
 class TestAccountBalanceImpactFromTransaction(unittest.TestCase):
@@ -263,6 +277,33 @@ class TestTransactionSerialization(unittest.TestCase):
         self.assertEqual(tx.raw, raw)
 
 
+class TestOutputClaimHash(unittest.TestCase):
+
+    def test_claim_id_follows_transaction_hash(self):
+        tx = get_claim_transaction('foo')
+        txo = tx.outputs[0]
+        claim_id = txo.claim_id
+        self.assertIs(txo.claim_id, claim_id)
+        self.assertEqual(txo.claim_hash, hash160(tx.hash + b'\x00\x00\x00\x00'))
+        tx.add_inputs([get_input(pubkey_hash=b'\x01'*32)])
+        self.assertNotEqual(txo.claim_id, claim_id)
+        self.assertEqual(txo.claim_hash, hash160(tx.hash + b'\x00\x00\x00\x00'))
+        self.assertEqual(txo.claim_id, hexlify(txo.claim_hash[::-1]).decode())
+
+
+class TestClaimOutputFilters(unittest.TestCase):
+
+    def test_my_abandon_outputs(self):
+        claim = get_claim_transaction('foo').outputs[0]
+        other = get_claim_transaction('bar').outputs[0]
+        update = Output.pay_update_claim_pubkey_hash(CENT, 'foo', claim.claim_id, b'', NULL_HASH32)
+        claim.is_my_output = other.is_my_output = update.is_my_output = True
+        tx = Transaction() \
+            .add_inputs([Input.spend(claim), Input.spend(other)]) \
+            .add_outputs([update])
+        self.assertEqual([txo.claim_name for txo in tx.my_abandon_outputs], ['bar'])
+
+
 class TestTransactionSigning(AsyncioTestCase):
 
     async def asyncSetUp(self):